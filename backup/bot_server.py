@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
 import os
+import math
 import time
-import queue
 import threading
+import collections
 import numpy as np
 import sounddevice as sd
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 import signal
 import sys
 
+try:
+    import orjson
+    json_dumps = orjson.dumps
+except ImportError:
+    import json
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 # --- Graceful Shutdown on SIGTERM/SIGINT ---
 def handle_exit(signum, frame):
     print(f"Received signal {signum}. Exiting bot_server.py.")
@@ -28,14 +37,83 @@ from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import rsa
 import datetime
 
+def get_app_dir():
+    if getattr(sys, 'frozen', False):
+        # Running in a PyInstaller bundle: __file__ lives in this process's
+        # own temp extraction dir, so keep certs next to the executable
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+CERT_DIR = os.path.join(get_app_dir(), "certs")
+# Legacy per-bot cert/key pairs shipped inside the bundle (datas in bot_server.spec)
+BUNDLED_CERT_DIR = os.path.join(getattr(sys, '_MEIPASS', get_app_dir()), "certs")
+
+def ensure_shared_key():
+    """
+    Return the path of the RSA key shared by all bots of this install,
+    generating it on first use.
+    """
+    os.makedirs(CERT_DIR, exist_ok=True)
+    keyfile = os.path.join(CERT_DIR, "_shared-key.pem")
+    if os.path.isfile(keyfile):
+        return keyfile
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    tmpfile = f"{keyfile}.{os.getpid()}.tmp"
+    try:
+        # Owner-only from the start, so the published key is never readable
+        # by other users
+        fd = os.open(tmpfile, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pem)
+        try:
+            # Atomic publish: if another bot got there first, keep its key
+            os.link(tmpfile, keyfile)
+        except FileExistsError:
+            return keyfile
+        except OSError:
+            # No hard links on this filesystem; exclusive create still keeps
+            # the first bot's key
+            try:
+                fd = os.open(keyfile, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                return keyfile
+            with os.fdopen(fd, "wb") as f:
+                f.write(pem)
+    finally:
+        try:
+            os.remove(tmpfile)
+        except FileNotFoundError:
+            pass
+    print(f"[CERT] Generated shared bot key: {keyfile}")
+    return keyfile
+
+def _cert_matches_key(certfile, key):
+    try:
+        with open(certfile, "rb") as f:
+            cert = x509.load_pem_x509_certificate(f.read())
+    except ValueError:
+        return False
+    return cert.public_key().public_numbers() == key.public_key().public_numbers()
+
 def ensure_bot_cert(bot_name):
-    cert_dir = os.path.join(os.path.dirname(__file__), "certs")
-    os.makedirs(cert_dir, exist_ok=True)
-    certfile = os.path.join(cert_dir, f"{bot_name}.pem")
-    keyfile  = os.path.join(cert_dir, f"{bot_name}-key.pem")
-    if os.path.isfile(certfile) and os.path.isfile(keyfile):
+    for cert_dir in dict.fromkeys((CERT_DIR, BUNDLED_CERT_DIR)):
+        certfile = os.path.join(cert_dir, f"{bot_name}.pem")
+        keyfile  = os.path.join(cert_dir, f"{bot_name}-key.pem")
+        if os.path.isfile(certfile) and os.path.isfile(keyfile):
+            # Certificate minted with its own key by an older version
+            return certfile, keyfile
+    certfile = os.path.join(CERT_DIR, f"{bot_name}.pem")
+    keyfile = ensure_shared_key()
+    with open(keyfile, "rb") as f:
+        key = serialization.load_pem_private_key(f.read(), password=None)
+    # Re-mint when the shared key was replaced since this cert was issued
+    if os.path.isfile(certfile) and _cert_matches_key(certfile, key):
         return certfile, keyfile
-    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
     subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u"{}".format(bot_name))])
     cert = (
         x509.CertificateBuilder()
@@ -47,30 +125,35 @@ def ensure_bot_cert(bot_name):
         .not_valid_after(datetime.datetime.utcnow() + datetime.timedelta(days=3650))
         .sign(key, hashes.SHA256())
     )
-    with open(keyfile, "wb") as f:
-        f.write(key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.TraditionalOpenSSL,
-            encryption_algorithm=serialization.NoEncryption(),
-        ))
     with open(certfile, "wb") as f:
         f.write(cert.public_bytes(serialization.Encoding.PEM))
     print(f"[CERT] Generated new certificate for {bot_name}: {certfile}")
     return certfile, keyfile
 
 # --- DEFAULT AUDIO DEVICES ---
-devs = sd.query_devices()
+# PortAudio's device list is fixed once it is initialised, so query it once
+DEVICES = list(sd.query_devices())
+
 try:
-    DEFAULT_IN  = next(i for i,d in enumerate(devs) if d["max_input_channels"]>0)
+    DEFAULT_IN  = next(i for i,d in enumerate(DEVICES) if d["max_input_channels"]>0)
 except StopIteration:
     print("No audio input devices found! Exiting.")
     sys.exit(1)
 try:
-    DEFAULT_OUT = next(i for i,d in enumerate(devs) if d["max_output_channels"]>0)
+    DEFAULT_OUT = next(i for i,d in enumerate(DEVICES) if d["max_output_channels"]>0)
 except StopIteration:
     print("No audio output devices found! Exiting.")
     sys.exit(1)
 
+SAMPLE_RATE = 48000
+# 10 ms blocks; Windows MME handles small blocks poorly, so use more there
+BLOCKSIZE   = 1024 if sys.platform == "win32" else 480
+PCM_BUF_SIZE = 4096  # default size of pooled PCM byte buffers
+MIC_RING_SLOTS = 32  # mic blocks buffered between the PortAudio callback and the mic pump
+DELAY_MARGIN_SLOTS = 16  # delay ring slots kept beyond the configured delay
+USER_MAP_REFRESH_DELAY = 0.1  # seconds to coalesce user/channel events over
+SSE_KEEPALIVE = 15.0  # seconds between keep-alive comments on an idle /events stream
+
 # --- CLI ARGUMENTS ---
 import argparse
 parser = argparse.ArgumentParser()
@@ -89,11 +172,25 @@ certfile, keyfile = ensure_bot_cert(USER)
 # --- MUMBLE DEPENDENCIES ---
 from pymumble_py3 import Mumble
 from pymumble_py3.constants import (
+    PYMUMBLE_CLBK_CONNECTED,
     PYMUMBLE_CLBK_SOUNDRECEIVED,
+    PYMUMBLE_CLBK_USERCREATED,
     PYMUMBLE_CLBK_USERUPDATED,
     PYMUMBLE_CLBK_USERREMOVED,
+    PYMUMBLE_CLBK_CHANNELCREATED,
+    PYMUMBLE_CLBK_CHANNELUPDATED,
+    PYMUMBLE_CLBK_CHANNELREMOVED,
 )
 
+def _field(obj, key, default=None):
+    """
+    Read a field of a pymumble user/channel. Those are dicts, so look the
+    key up directly instead of a failing getattr followed by .get().
+    """
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
 class LoopBot:
     """
     Main class that manages Mumble connection, audio I/O, state, delay, and volume logic.
@@ -104,50 +201,111 @@ class LoopBot:
         self.loop      = None           # currently joined loop (channel) name
         self.streaming = False          # True if currently "talking"
         self.status    = "Starting…"
-        self._recv_q   = queue.Queue()  # queue for received PCM audio
+        self._recv_deque = collections.deque()  # (bytearray, nbytes) received PCM audio
+        self._recv_evt   = threading.Event()    # set when _recv_deque gets data
+        self._pcm_pool = collections.deque(maxlen=64)  # recycled PCM bytearrays
+        self._pcm_pool_lock = threading.Lock()
         self.playback_volume = 1.0      # Output volume (0.0-1.0)
-        self._connect_mumble()          # connect to Mumble server
-        self._start_mic_stream()        # start microphone input stream
-        self._start_playback_thread()   # start thread for playback
-        self._users_by_channel = {}     # channel_id -> user count
+        self._vol_q15  = 32768          # playback_volume in Q15 fixed point
+        # Preallocated scratch buffers, reused by every audio block
+        self._play_i32 = np.empty(PCM_BUF_SIZE // 2, np.int32)
+        self._play_i16 = np.empty(PCM_BUF_SIZE // 2, np.int16)
+        # Mic ring: the PortAudio callback fills slots at _mic_head,
+        # the mic pump thread drains them from _mic_tail
+        self._mic_ring     = np.empty((MIC_RING_SLOTS, BLOCKSIZE), np.int16)
+        self._mic_ring_len = np.zeros(MIC_RING_SLOTS, np.int32)
+        self._mic_head     = 0
+        self._mic_tail     = 0
+        self._mic_ready    = threading.Event()
 
         # === DELAY feature (robust version) ===
         self.audio_delay_enabled = False        # if delay is active
         self.audio_delay_seconds = 3           # delay length (seconds)
-        self.audio_delay_queue = queue.Queue() # queue for delayed audio
+        # Delay ring: preallocated PCM slots written at _delay_head by the
+        # mic pump and played out from _delay_tail by the delay worker
+        self._delay_lock  = threading.Lock()
+        self._delay_ready = threading.Event()
+        self._delay_state_changed = threading.Event()  # wakes the worker on enable/disable
+        self._delay_head  = 0
+        self._delay_tail  = 0
+        self._delay_slots = self._alloc_delay_ring(self.audio_delay_seconds)
         self._delay_thread = threading.Thread(target=self._delay_audio_worker, daemon=True)
         self._delay_thread.start()
 
+        self._users_by_channel = {}     # channel_id -> user count
+        self._channel_rows = []         # (channel_id, name, channel), normalized once per change
+        self._channels_by_name = {}     # channel name -> (channel_id, channel)
+        self._user_counts_snapshot = {} # channel name -> user count, served by /status
+        self._users_json = json_dumps({'users': []})  # /users body, rebuilt with the user map
+        self._refresh_pending = False   # a coalesced _update_user_map is scheduled
+        self._refresh_lock = threading.Lock()
+        self._state_version = 0         # bumped whenever report() may have changed
+        self._state_cond = threading.Condition()
+        self._connect_mumble()          # connect to Mumble server
+        self._start_mic_pump_thread()   # start thread draining the mic ring
+        self._start_mic_stream()        # start microphone input stream
+        self._start_playback_thread()   # start thread for playback
+
+    def _alloc_delay_ring(self, seconds):
+        """
+        Build (slots, timestamps, lengths) for a delay ring big enough to
+        hold `seconds` of mic blocks plus a safety margin.
+        """
+        n = math.ceil(seconds * SAMPLE_RATE / BLOCKSIZE) + DELAY_MARGIN_SLOTS
+        return (
+            [bytearray(BLOCKSIZE * 2) for _ in range(n)],
+            np.zeros(n, np.float64),
+            np.zeros(n, np.int32),
+        )
+
     def enable_audio_delay(self, seconds=3):
-        self.audio_delay_enabled = True
+        needed = math.ceil(seconds * SAMPLE_RATE / BLOCKSIZE) + DELAY_MARGIN_SLOTS
+        if needed > len(self._delay_slots[0]):
+            slots = self._alloc_delay_ring(seconds)
+            with self._delay_lock:
+                self._delay_slots = slots
+                self._delay_tail  = self._delay_head
         self.audio_delay_seconds = seconds
+        self.audio_delay_enabled = True
+        self._delay_state_changed.set()
         # print(f"[DELAY] Enabled with {seconds}s")
 
     def disable_audio_delay(self):
         self.audio_delay_enabled = False
-        # Immediately flush the queue
-        flushed = 0
-        while not self.audio_delay_queue.empty():
-            try:
-                self.audio_delay_queue.get_nowait()
-                flushed += 1
-            except Exception:
-                break
-        # print(f"[DELAY] Disabled. Flushed {flushed} audio chunks.")
+        # Immediately drop everything still waiting in the ring
+        with self._delay_lock:
+            self._delay_tail = self._delay_head
+        self._delay_state_changed.set()
+        # print("[DELAY] Disabled. Flushed delay ring.")
 
     def _delay_audio_worker(self):
         while True:
             try:
-                tstamp, pcm = self.audio_delay_queue.get()
-                if not self.audio_delay_enabled:
-                    # Discard all queued audio when delay is off
-                    # print("[DELAY WORKER] Discarding chunk (delay is OFF)")
+                with self._delay_lock:
+                    ring, stamps, lengths = self._delay_slots
+                    tail, head = self._delay_tail, self._delay_head
+                    if head - tail > len(ring):
+                        # Fell a whole ring behind: oldest slots were overwritten
+                        tail = self._delay_tail = head - len(ring)
+                if tail >= head:
+                    self._delay_ready.wait()
+                    self._delay_ready.clear()
+                    continue
+                slot = tail % len(ring)
+                wait_needed = (stamps[slot] + self.audio_delay_seconds) - time.time()
+                if wait_needed > 0 and self._delay_state_changed.wait(timeout=wait_needed):
+                    # Delay toggled or resized mid-wait: re-evaluate from scratch
+                    self._delay_state_changed.clear()
                     continue
-                wait_needed = (tstamp + self.audio_delay_seconds) - time.time()
-                if wait_needed > 0:
-                    time.sleep(wait_needed)
+                with self._delay_lock:
+                    if self._delay_tail != tail:
+                        # Ring was flushed while we waited
+                        continue
+                    pcm = bytes(memoryview(ring[slot])[:int(lengths[slot])])
+                    self._delay_tail = tail + 1
                 # Play out only if in "talking" mode
-                if self.streaming and self.client and getattr(self.client, "sound_output", None):
+                if self.audio_delay_enabled and self.streaming and self.client \
+                   and getattr(self.client, "sound_output", None):
                     try:
                         self.client.sound_output.add_sound(pcm)
                     except Exception as e:
@@ -157,18 +315,51 @@ class LoopBot:
                 time.sleep(0.01)
 
     def _mic_callback(self, indata, frames, ti, status):
-        if indata is None or len(indata) == 0:
-            return
-        try:
-            pcm = (indata[:,0] * 32767).astype(np.int16).tobytes()
-        except Exception as e:
-            print(f"[MIC CALLBACK ERROR] Could not convert indata to PCM: {e}")
-            return
+        # Runs on the PortAudio thread: copy the block into the ring and
+        # wake the pump. The Event's lock is released while the pump waits,
+        # so set() practically never contends.
+        head = self._mic_head
+        slot = head % MIC_RING_SLOTS
+        self._mic_ring[slot, :frames] = indata[:frames, 0]
+        self._mic_ring_len[slot] = frames
+        self._mic_head = head + 1
+        self._mic_ready.set()
+
+    def _mic_pump(self):
+        """
+        Background thread: drains the mic ring filled by the PortAudio
+        callback and sends each int16 PCM block on.
+        """
+        while True:
+            self._mic_ready.wait()
+            self._mic_ready.clear()
+            while self._mic_tail < self._mic_head:
+                if self._mic_head - self._mic_tail > MIC_RING_SLOTS:
+                    # Fell a whole ring behind: skip the overwritten blocks
+                    self._mic_tail = self._mic_head - MIC_RING_SLOTS
+                slot = self._mic_tail % MIC_RING_SLOTS
+                frames = int(self._mic_ring_len[slot])
+                self._send_mic_pcm(self._mic_ring[slot, :frames])
+                self._mic_tail += 1
+
+    def _start_mic_pump_thread(self):
+        t = threading.Thread(target=self._mic_pump, daemon=True)
+        t.start()
+
+    def _send_mic_pcm(self, i16):
         if self.audio_delay_enabled:
-            self.audio_delay_queue.put((time.time(), pcm))
+            ring, stamps, lengths = self._delay_slots
+            head = self._delay_head
+            slot = head % len(ring)
+            nbytes = i16.nbytes
+            memoryview(ring[slot])[:nbytes] = memoryview(i16).cast('B')
+            lengths[slot] = nbytes
+            stamps[slot] = time.time()
+            self._delay_head = head + 1
+            self._delay_ready.set()
         elif self.streaming and self.client and getattr(self.client, "sound_output", None):
             try:
-                self.client.sound_output.add_sound(pcm)
+                self.client.sound_output.add_sound(i16.tobytes())
             except Exception as e:
                 print(f"[AUDIO OUT ERROR] {e}")
 
@@ -177,36 +368,61 @@ class LoopBot:
             SERVER, USER, port=PORT, reconnect=True,
             certfile=certfile, keyfile=keyfile,
         )
-        self.client.callbacks.set_callback(PYMUMBLE_CLBK_USERUPDATED,  lambda u,e: self._update_user_map())
-        self.client.callbacks.set_callback(PYMUMBLE_CLBK_USERREMOVED,  lambda u,e: self._update_user_map())
+        self.client.callbacks.set_callback(PYMUMBLE_CLBK_USERCREATED,  lambda u: self._schedule_user_map_refresh())
+        self.client.callbacks.set_callback(PYMUMBLE_CLBK_USERUPDATED,  lambda u,e: self._schedule_user_map_refresh())
+        self.client.callbacks.set_callback(PYMUMBLE_CLBK_USERREMOVED,  lambda u,e: self._schedule_user_map_refresh())
+        self.client.callbacks.set_callback(PYMUMBLE_CLBK_CHANNELCREATED, lambda *a: self._schedule_user_map_refresh())
+        self.client.callbacks.set_callback(PYMUMBLE_CLBK_CHANNELUPDATED, lambda *a: self._schedule_user_map_refresh())
+        self.client.callbacks.set_callback(PYMUMBLE_CLBK_CHANNELREMOVED, lambda *a: self._schedule_user_map_refresh())
         self.client.set_receive_sound(True)
         self.client.callbacks.set_callback(
             PYMUMBLE_CLBK_SOUNDRECEIVED, self._on_sound_received
         )
+        ready = threading.Event()
+        self.client.callbacks.set_callback(PYMUMBLE_CLBK_CONNECTED, ready.set)
         self.client.start()
         if hasattr(self.client, "undeafen"): self.client.undeafen()
         elif hasattr(self.client, "set_deaf"): self.client.set_deaf(False)
         if hasattr(self.client, "unmute"):   self.client.unmute()
         elif hasattr(self.client, "set_mute"): self.client.set_mute(False)
-        for _ in range(20):
-            if getattr(self.client, "connected", False): break
-            time.sleep(0.2)
-        else:
+        if not ready.wait(timeout=4.0):
             raise RuntimeError("Mumble connect timeout")
         self.status = "Connected"
         self._update_user_map()
 
     def _on_sound_received(self, user, soundchunk):
-        # Receive PCM from others, put to playback queue
-        self._recv_q.put(soundchunk.pcm)
+        # Receive PCM from others, copy into a pooled buffer for the playback queue
+        pcm = soundchunk.pcm
+        nbytes = len(pcm)
+        buf = self._acquire_buf(nbytes)
+        memoryview(buf)[:nbytes] = pcm
+        # deque.append is atomic under the GIL; the event wakes the single consumer
+        self._recv_deque.append((buf, nbytes))
+        self._recv_evt.set()
+
+    def _acquire_buf(self, n):
+        """
+        Take a recycled bytearray of at least n bytes from the pool,
+        allocating a bigger one if the pooled buffer is too small.
+        """
+        with self._pcm_pool_lock:
+            buf = self._pcm_pool.pop() if self._pcm_pool else None
+        if buf is None or len(buf) < n:
+            buf = bytearray(max(n, PCM_BUF_SIZE))
+        return buf
+
+    def _release_buf(self, buf):
+        with self._pcm_pool_lock:
+            self._pcm_pool.append(buf)
 
     def _start_mic_stream(self):
         self._mic_stream = sd.InputStream(
             device=self.dev_in,
             channels=1,
-            samplerate=48000,
-            blocksize=2048,
-            latency=0.1,
+            samplerate=SAMPLE_RATE,
+            dtype="int16",      # PortAudio converts and clips to int16 in C
+            blocksize=BLOCKSIZE,
+            latency='low',
             callback=self._mic_callback
         )
         self._mic_stream.start()
@@ -214,22 +430,41 @@ class LoopBot:
     def _playback_thread(self):
         """
         Background thread: plays back received PCM to output device,
-        scaling by the current volume.
+        scaling by the current volume in Q15 fixed point. At full volume
+        the PCM is written out untouched.
         """
         with sd.RawOutputStream(
             device=self.dev_out,
             channels=1,
-            samplerate=48000,
+            samplerate=SAMPLE_RATE,
             dtype="int16",
-            blocksize=2048,
-            latency=0.1
+            blocksize=BLOCKSIZE,
+            latency='low'
         ) as outstream:
             while True:
-                pcm = self._recv_q.get()
-                arr = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
-                arr *= self.playback_volume
-                arr = np.clip(arr, -32768, 32767).astype(np.int16)
-                outstream.write(arr.tobytes())
+                while not self._recv_deque:
+                    self._recv_evt.wait()
+                    self._recv_evt.clear()
+                buf, nbytes = self._recv_deque.popleft()
+                vol_q15 = self._vol_q15
+                if vol_q15 == 32768:
+                    outstream.write(memoryview(buf)[:nbytes])
+                    self._release_buf(buf)
+                    continue
+                src = np.frombuffer(buf, dtype=np.int16, count=nbytes // 2)
+                n = src.size
+                if n > self._play_i32.size:
+                    self._play_i32 = np.empty(n, np.int32)
+                    self._play_i16 = np.empty(n, np.int16)
+                acc = self._play_i32[:n]
+                i16 = self._play_i16[:n]
+                # Two ufunc passes whose inner loops run without the GIL. With
+                # vol_q15 < 32768 the shifted product always fits in int16,
+                # so the shift narrows straight into the output buffer.
+                np.multiply(src, vol_q15, out=acc, dtype=np.int32)
+                np.right_shift(acc, 15, out=i16, casting='unsafe')
+                outstream.write(i16)
+                self._release_buf(buf)
 
     def _start_playback_thread(self):
         t = threading.Thread(target=self._playback_thread, daemon=True)
@@ -240,23 +475,23 @@ class LoopBot:
         self.dev_in = idx
         self.status = f"Input → {idx}"
         self._start_mic_stream()
+        self._state_changed()
 
     def set_output(self, idx):
         self.dev_out = idx
         self.status  = f"Output → {idx}"
+        self._state_changed()
 
     def _move_to_loop(self):
-        target = self.loop or "Root"
-        for cid, ch in self.client.channels.items():
-            name = getattr(ch, 'name', None) or ch.get('name', '')
-            if name == target:
-                ch.move_in()
-                break
+        entry = self._channels_by_name.get(self.loop or "Root")
+        if entry:
+            entry[1].move_in()
 
     def join(self, loop_name):
         self.loop   = loop_name
         self.status = f"Listen → {loop_name or 'Root'}"
         self._move_to_loop()
+        self._state_changed()
 
     def leave(self):
         self.join(None)
@@ -264,124 +499,199 @@ class LoopBot:
     def talk(self):
         self.streaming = True
         self.status    = f"Talk → {self.loop or 'Root'}"
+        self._state_changed()
 
     def mute(self):
         self.streaming = False
         self.status    = f"Muted → {self.loop or 'Root'}"
+        self._state_changed()
 
     def stop(self):
         self.mute()
         try: self._mic_stream.close()
-        except: pass
+        except Exception: pass
         self.status = "Stopped"
+        self._state_changed()
 
     def set_volume(self, vol):
         """
         Set playback volume (0.0-1.0).
         """
         self.playback_volume = max(0.0, min(1.0, float(vol)))
+        self._vol_q15 = int(round(self.playback_volume * 32768))
+
+    def _schedule_user_map_refresh(self):
+        """
+        Coalesce bursts of user/channel events into a single
+        _update_user_map run at most USER_MAP_REFRESH_DELAY later.
+        """
+        with self._refresh_lock:
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
+        t = threading.Timer(USER_MAP_REFRESH_DELAY, self._do_user_map_refresh)
+        t.daemon = True
+        t.start()
+
+    def _do_user_map_refresh(self):
+        with self._refresh_lock:
+            self._refresh_pending = False
+        self._update_user_map()
 
     def _update_user_map(self):
         channel_users = {}
         try:
-            chans = {int(cid): ch for cid, ch in self.client.channels.items()}
+            rows = [
+                (int(cid), _field(ch, 'name') or '', ch)
+                for cid, ch in list(self.client.channels.items())
+            ]
         except Exception:
-            chans = {}
+            rows = self._channel_rows
+        channels_by_name = {}
+        for cid, name, ch in rows:
+            channels_by_name.setdefault(name, (cid, ch))
+        names = []
         users = getattr(self.client, 'users', {})
-        for user in users.values():
+        for user in list(users.values()):
             try:
-                ch_id = getattr(user, 'channel_id', None)
-                if ch_id is None:
-                    ch_id = user.get('channel_id', None)
+                names.append(_field(user, 'name'))
+                ch_id = _field(user, 'channel_id')
                 if ch_id is not None:
                     channel_users.setdefault(ch_id, 0)
                     channel_users[ch_id] += 1
             except Exception:
                 continue
         self._users_by_channel = channel_users
+        self._channel_rows = rows
+        self._channels_by_name = channels_by_name
+        self._user_counts_snapshot = {
+            name: channel_users.get(cid, 0)
+            for name, (cid, _) in channels_by_name.items()
+        }
+        self._users_json = json_dumps({'users': names})
+        self._state_changed()
+
+    def _state_changed(self):
+        with self._state_cond:
+            self._state_version += 1
+            self._state_cond.notify_all()
+
+    def wait_for_change(self, version, timeout):
+        """
+        Block until the state version differs from `version` or `timeout`
+        elapses, and return the current version.
+        """
+        with self._state_cond:
+            self._state_cond.wait_for(lambda: self._state_version != version, timeout)
+            return self._state_version
 
     def get_channel_user_count(self, name):
-        for cid, ch in self.client.channels.items():
-            chname = getattr(ch, 'name', None) or ch.get('name', '')
-            if chname == name:
-                return self._users_by_channel.get(int(cid), 0)
-        return 0
+        entry = self._channels_by_name.get(name)
+        if entry is None:
+            return 0
+        return self._users_by_channel.get(entry[0], 0)
 
     def report(self):
-        user_counts = {}
-        for cid, ch in self.client.channels.items():
-            chname = getattr(ch, 'name', None) or ch.get('name', '')
-            user_counts[chname] = self._users_by_channel.get(int(cid), 0)
         return {
             'status':     self.status,
             'loop':       self.loop,
             'talking':    self.streaming,
             'device_in':  self.dev_in,
             'device_out': self.dev_out,
-            'user_counts': user_counts,
+            'user_counts': self._user_counts_snapshot,
         }
 
+    def users_json(self):
+        """Return the /users body, serialized when the user map was last rebuilt."""
+        return self._users_json
+
 # --- FLASK API SERVER ---
 app = Flask(__name__)
 bot = LoopBot()
 
+# Body shared by all the command routes, serialized once
+OK_BODY = b'{"ok":true}\n'
+
+def ok_response():
+    return Response(OK_BODY, mimetype='application/json')
+
+def json_response(payload):
+    return Response(json_dumps(payload), mimetype='application/json')
+
 @app.route('/status')
 def status():
-    return jsonify(bot.report())
+    return json_response(bot.report())
+
+@app.route('/events')
+def events():
+    """
+    Server-Sent Events stream of report(), pushed whenever the state changes.
+    """
+    def stream():
+        version = -1
+        while True:
+            new_version = bot.wait_for_change(version, SSE_KEEPALIVE)
+            if new_version == version:
+                yield b": keepalive\n\n"
+                continue
+            version = new_version
+            yield b"data: " + json_dumps(bot.report()) + b"\n\n"
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
 
 @app.route('/join', methods=['POST'])
 def join():
     bot.join(request.json.get('loop'))
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/leave', methods=['POST'])
 def leave():
     bot.leave()
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/talk', methods=['POST'])
 def talk():
     bot.talk()
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/mute', methods=['POST'])
 def mute():
     bot.mute()
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/device_in', methods=['POST'])
 def device_in():
     bot.set_input(int(request.json['device']))
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/device_out', methods=['POST'])
 def device_out():
     bot.set_output(int(request.json['device']))
-    return jsonify(ok=True)
+    return ok_response()
+
+@app.route('/devices')
+def devices():
+    return json_response({'devices': DEVICES})
 
 @app.route('/stop', methods=['POST'])
 def stop():
     bot.stop()
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/users')
 def users():
-    users = []
-    for user in getattr(bot.client, "users", {}).values():
-        u_name = getattr(user, "name", None) or user.get("name")
-        users.append(u_name)
-    return jsonify(users=users)
+    return Response(bot.users_json(), mimetype='application/json')
 
 @app.route('/delay_on', methods=['POST'])
 def delay_on():
     seconds = request.json.get('seconds', 3)
     bot.enable_audio_delay(seconds)
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/delay_off', methods=['POST'])
 def delay_off():
     bot.disable_audio_delay()
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/leave_after_delay', methods=['POST'])
 def leave_after_delay():
@@ -390,7 +700,7 @@ def leave_after_delay():
         bot.mute()
         bot.leave()
     threading.Thread(target=delayed_leave, daemon=True).start()
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/mute_after_delay', methods=['POST'])
 def mute_after_delay():
@@ -398,7 +708,7 @@ def mute_after_delay():
         time.sleep(bot.audio_delay_seconds)
         bot.mute()
     threading.Thread(target=delayed_mute, daemon=True).start()
-    return jsonify(ok=True)
+    return ok_response()
 
 @app.route('/set_volume', methods=['POST'])
 def set_volume():
@@ -407,7 +717,14 @@ def set_volume():
     """
     vol = float(request.json.get('volume', 1.0))
     bot.set_volume(vol)
-    return jsonify(ok=True)
+    return ok_response()
 
 if __name__ == '__main__':
-    app.run(host='127.0.0.1', port=args.api_port)
+    try:
+        from waitress import serve
+    except ImportError:
+        # Werkzeug dev server as a fallback when waitress isn't installed
+        app.run(host='127.0.0.1', port=args.api_port, threaded=True)
+    else:
+        # Each open /events stream holds a worker thread
+        serve(app, host='127.0.0.1', port=args.api_port, threads=6, connection_limit=64)
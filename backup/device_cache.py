@@ -0,0 +1,20 @@
+# device_cache.py
+import threading
+import sounddevice as sd
+
+_cache = None          # (ins, outs) lists of (index, name)
+_lock = threading.Lock()
+
+def get_devices():
+    """
+    Return (ins, outs) as lists of (device index, name). PortAudio's device
+    list is fixed once it is initialised, so it is enumerated only once.
+    """
+    global _cache
+    with _lock:
+        if _cache is None:
+            devs = sd.query_devices()
+            ins  = [(i, d['name']) for i, d in enumerate(devs) if d['max_input_channels']>0]
+            outs = [(i, d['name']) for i, d in enumerate(devs) if d['max_output_channels']>0]
+            _cache = (ins, outs)
+        return _cache
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
-import sys, time, threading, json, os
-import requests
-import sounddevice as sd
+import sys, time, json, os, heapq, atexit
+from concurrent.futures import ThreadPoolExecutor, wait
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QLabel, QComboBox, QPushButton, QGroupBox, QFrame, QSizePolicy, QSlider
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QPixmap, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QUrl, QRectF
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from PyQt6.QtGui import QPixmap, QIcon, QBrush, QColor, QPainter, QPainterPath
 from soundwave import SoundwaveWidget  # Custom widget for mic audio visualization
 from config_dialog import read_config
 
@@ -31,12 +36,42 @@ BOTS = [
     {"name": "BOT2", "port": 6002},
     {"name": "BOT3", "port": 6003},
 ]
+TICK_MS       = 33    # master UI tick: soundwave animation and level meter
 POLL_INTERVAL = 1.0
+POLL_TICKS    = round(POLL_INTERVAL * 1000 / TICK_MS)  # master ticks between fallback polls
+POLL_TIMEOUT  = 0.5   # seconds before a /status request is given up
+HTTP_TIMEOUT  = 2.0   # seconds before a command POST to a bot is given up
+STREAM_RETRY  = 5.0   # seconds before reopening a bot's closed /events stream
+STREAM_IDLE_TIMEOUT = 45.0  # seconds of silence before an /events stream is dropped (bots send a keep-alive every 15 s)
+DEAD_BOT_BACKOFF = 5.0  # seconds a bot that failed a request is left out of polls
+VOLUME_FLUSH_MS = 50  # slider drags send at most one /set_volume per loop per interval
+LOGO_HEIGHT = 70
+
+# Loaded on first use (a QApplication must exist) and shared afterwards
+_LOGO_PIXMAPS = {}  # height -> scaled logo.png
+_APP_ICON = None
+
+def _logo(h=LOGO_HEIGHT):
+    pixmap = _LOGO_PIXMAPS.get(h)
+    if pixmap is None:
+        pixmap = QPixmap("logo.png")
+        if not pixmap.isNull():
+            pixmap = pixmap.scaledToHeight(h, Qt.TransformationMode.SmoothTransformation)
+        _LOGO_PIXMAPS[h] = pixmap
+    return pixmap
+
+def _app_icon():
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon("logo2.png")
+    return _APP_ICON
 
 class LoopButtonWidget(QFrame):
     clicked = pyqtSignal(str)
     off_clicked = pyqtSignal(str)
     volume_changed = pyqtSignal(str, float)  # loop_name, volume (0.0-1.0)
+    CORNER_RADIUS = 20
+    _brushes = {}  # color string -> QBrush, shared by all buttons
 
     def __init__(self, loop_cfg, parent=None):
         super().__init__(parent)
@@ -45,10 +80,13 @@ class LoopButtonWidget(QFrame):
         BUTTON_SIZE = 170
         ICON_ROW_HEIGHT = 28
         BORDER = 4
-        self.setFrameShape(QFrame.Shape.Box)
-        self.setLineWidth(2)
+        # The rounded background is painted in paintEvent; a native
+        # Box frame would draw square corners around it
+        self.setFrameShape(QFrame.Shape.NoFrame)
         self.setFixedSize(BUTTON_SIZE, BUTTON_SIZE)
-        self.setStyleSheet("background-color: #cccccc; border-radius: 20px;")
+        # Background is painted in paintEvent; no stylesheet to re-parse per state change
+        self._bg = self._brush("#cccccc")
+        self._bg_path = self._rounded_path()
         self.icon_label = QLabel(self)
         icons = []
         if loop_cfg.get("can_listen"): icons.append("🎧")
@@ -63,7 +101,10 @@ class LoopButtonWidget(QFrame):
         self.name_label = QLabel(self.loop_name, self)
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.name_label.setWordWrap(True)
-        self.name_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        font = self.name_label.font()
+        font.setPixelSize(16)
+        font.setBold(True)
+        self.name_label.setFont(font)
         self.name_label.setFixedWidth(BUTTON_SIZE - 2*BORDER)
         self.name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -93,8 +134,26 @@ class LoopButtonWidget(QFrame):
         self.slider.setStyleSheet("background-color: #b3d8fd;")
         self.slider_visible = False
 
+    @classmethod
+    def _brush(cls, color):
+        brush = cls._brushes.get(color)
+        if brush is None:
+            brush = cls._brushes[color] = QBrush(QColor(color))
+        return brush
+
+    def _rounded_path(self):
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect()), self.CORNER_RADIUS, self.CORNER_RADIUS)
+        return path
+
     def set_bg(self, color):
-        self.setStyleSheet(f"background-color: {color}; border-radius: 20px;")
+        self._bg = self._brush(color)
+        self.update()
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.fillPath(self._bg_path, self._bg)
+        p.end()
     def set_count(self, n):
         self.count_label.setText(f"👥{n}")
     def mousePressEvent(self, e):
@@ -120,6 +179,7 @@ class LoopButtonWidget(QFrame):
         self.off_btn.move(BUTTON_SIZE-56, BUTTON_SIZE-32)
         self.vol_btn.move(12, BUTTON_SIZE-32)
         self.slider.move(16, BUTTON_SIZE-110)
+        self._bg_path = self._rounded_path()
         super().resizeEvent(event)
 
     def toggle_volume_slider(self):
@@ -134,6 +194,9 @@ class LoopButtonWidget(QFrame):
         self.volume_changed.emit(self.loop_name, value / 100.0)
 
 class MainWindow(QWidget):
+    status_received = pyqtSignal(str, object)  # bot name, parsed /status dict or None
+    _COLORS = {0: "#cccccc", 1: "#87cefa", 2: "#90ee90"}  # loop state -> button color
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("MCC Voice Loops Controller")
@@ -141,27 +204,48 @@ class MainWindow(QWidget):
         self.delay_enabled = False
         self.delay_seconds = 3
         self.loop_states = {loop["name"]: (0, None) for loop in LOOPS}
+        self._talking    = set()  # names of loops currently in state 2
         self.user_counts = {loop["name"]: 0 for loop in LOOPS}
         self.buttons     = {}
+        self._last_rendered = {}  # loop name -> (color, count) last applied to its button
         self.loop_configs = {loop["name"]: loop for loop in LOOPS}
         self.bot_pool = {b["name"]: {"port": b["port"], "assigned": None, "last_used": 0} for b in BOTS}
+        # (last_used, name) of idle bots; stale entries are skipped lazily in _find_idle_bot
+        self._idle_heap = [(data["last_used"], name) for name, data in self.bot_pool.items()]
+        heapq.heapify(self._idle_heap)
+
+        # --- HTTP to the bots: one keep-alive session (built in _late_init),
+        # one serial worker per bot ---
+        self.http = None
+        self.bot_io = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"http-{name}")
+            for name in self.bot_pool
+        }
+        self.http_errors = {name: 0 for name in self.bot_pool}  # consecutive failures per bot
+        self._dead_bots = {}  # bot name -> monotonic time until which it is skipped
+        self._polling = set()  # bots with a /status request in flight
+        self.net = QNetworkAccessManager(self)
+        self._streams = {}      # bot name -> live /events QNetworkReply
+        self._stream_bufs = {}  # bot name -> bytes of a partially received event
+        self._stream_retry = {} # bot name -> monotonic time after which to reopen its stream
+        self._stream_down = set()  # bots whose stream closure has been logged
+        self._pending_talk = {}  # bot name -> single-shot QTimer for a delayed /talk
+        self._vol_pending = {}   # loop name -> latest slider value not yet sent
+        self._vol_timer = QTimer(self)
+        self._vol_timer.setSingleShot(True)
+        self._vol_timer.setInterval(VOLUME_FLUSH_MS)
+        self._vol_timer.timeout.connect(self._flush_volumes)
+        self.status_received.connect(self._apply_status)
 
         layout = QVBoxLayout(self)
 
         # --- Audio device selection ---
-        devs = sd.query_devices()
-        ins  = [(i, d['name']) for i, d in enumerate(devs) if d['max_input_channels']>0]
-        outs = [(i, d['name']) for i, d in enumerate(devs) if d['max_output_channels']>0]
         device_group = QGroupBox("Audio Devices")
         device_layout = QHBoxLayout()
         device_layout.setContentsMargins(8, 4, 8, 4)
         device_layout.setSpacing(10)
         self.in_combo  = QComboBox()
         self.out_combo = QComboBox()
-        for i,n in ins:  self.in_combo.addItem(f"{i}: {n}", i)
-        for i,n in outs: self.out_combo.addItem(f"{i}: {n}", i)
-        self.in_combo.currentIndexChanged.connect(self.on_in_changed)
-        self.out_combo.currentIndexChanged.connect(self.on_out_changed)
         self.in_combo.setMaximumHeight(28)
         self.out_combo.setMaximumHeight(28)
         device_layout.addWidget(QLabel("Input:"))
@@ -184,10 +268,13 @@ class MainWindow(QWidget):
 
         # --- Mic audio monitor ---
         self._audio_level = 0
-        self._audio_monitor_running = True
-        self._audio_thread = None
-        self._audio_input_idx = self.in_combo.currentData() or 0
-        self._start_audio_monitor()
+        self._in_stream = None
+
+        # --- One timer drives the soundwave, the level meter and the fallback poll ---
+        self._ticks = 0
+        self._master = QTimer(self)
+        self._master.setTimerType(Qt.TimerType.CoarseTimer)
+        self._master.timeout.connect(self._tick)
 
         # --- Loop buttons grid ---
         grid = QGridLayout()
@@ -207,20 +294,49 @@ class MainWindow(QWidget):
 
         # --- Logo / bottom bar ---
         logo_label = QLabel()
-        pixmap = QPixmap("logo.png")
+        pixmap = _logo()
         if not pixmap.isNull():
-            logo_size = 70
-            scaled = pixmap.scaledToHeight(logo_size, Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(scaled)
+            logo_label.setPixmap(pixmap)
         logo_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom)
-        logo_label.setMaximumHeight(logo_size)
-        logo_label.setMaximumWidth(logo_size*4)
+        logo_label.setMaximumHeight(LOGO_HEIGHT)
+        logo_label.setMaximumWidth(LOGO_HEIGHT*4)
         bottom_layout = QHBoxLayout()
         bottom_layout.addStretch(1)
         bottom_layout.addWidget(logo_label, stretch=0, alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom)
         layout.addLayout(bottom_layout)
         self.setLayout(layout)
-        self._start_poll()
+        QTimer.singleShot(0, self._late_init)
+
+    def _late_init(self):
+        """
+        Finish start-up once the window is on screen. Importing requests
+        and sounddevice and enumerating audio devices are the slow part
+        of a cold start, so they wait until after the first paint.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from device_cache import get_devices
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
+        atexit.register(self.http.close)
+
+        ins, outs = get_devices()
+        for i,n in ins:  self.in_combo.addItem(f"{i}: {n}", i)
+        for i,n in outs: self.out_combo.addItem(f"{i}: {n}", i)
+        self.in_combo.currentIndexChanged.connect(self.on_in_changed)
+        self.out_combo.currentIndexChanged.connect(self.on_out_changed)
+        self._start_audio_monitor(self.in_combo.currentData() or 0)
+
+        for bot_name in self.bot_pool:
+            self._open_stream(bot_name)
+        self._master.start(TICK_MS)
+
+    def _tick(self):
+        self._ticks += 1
+        self.soundwave_widget.update_phase()
+        self._update_soundwave()
+        if self._ticks % POLL_TICKS == 0:
+            self._poll_status()
 
     def _update_delay_btn_style(self):
         if self.delay_enabled:
@@ -231,109 +347,252 @@ class MainWindow(QWidget):
     def toggle_delay(self):
         self.delay_enabled = not self.delay_enabled
         self._update_delay_btn_style()
+        if self.delay_enabled:
+            self._post_all("delay_on", {"seconds": self.delay_seconds})
+        else:
+            self._post_all("delay_off")
+
+    def _start_audio_monitor(self, idx):
+        # idx is read from the combo on the Qt thread by the caller; the
+        # PortAudio callback never touches Qt widgets
+        self._stop_audio_monitor()
+        self._audio_input_idx = idx
         try:
-            for bot in self.bot_pool.values():
-                if self.delay_enabled:
-                    requests.post(f"http://127.0.0.1:{bot['port']}/delay_on", json={"seconds": self.delay_seconds})
-                else:
-                    requests.post(f"http://127.0.0.1:{bot['port']}/delay_off")
-        except:
-            pass
-
-    def _start_audio_monitor(self):
-        if hasattr(self, '_audio_monitor_running'):
-            self._audio_monitor_running = False
-            time.sleep(0.07)
-        self._audio_monitor_running = True
-        self._audio_input_idx = self.in_combo.currentData() or 0
-        def audio_thread_func():
-            while self._audio_monitor_running:
-                idx = self.in_combo.currentData() or 0
-                try:
-                    with sd.InputStream(device=idx, channels=1, samplerate=16000, blocksize=512) as stream:
-                        while self._audio_monitor_running:
-                            data, _ = stream.read(512)
-                            level = np.abs(data).mean()
-                            self._audio_level = float(level)
-                            time.sleep(0.025)
-                except Exception:
-                    self._audio_level = 0
-                    time.sleep(0.5)
-        self._audio_thread = threading.Thread(target=audio_thread_func, daemon=True)
-        self._audio_thread.start()
-        self._audio_timer = QTimer(self)
-        self._audio_timer.timeout.connect(self._update_soundwave)
-        self._audio_timer.start(50)
+            import sounddevice as sd
+            self._in_stream = sd.InputStream(
+                device=self._audio_input_idx, channels=1, samplerate=16000,
+                blocksize=512, latency='low', callback=self._audio_cb,
+            )
+            self._in_stream.start()
+        except Exception as e:
+            print(f"Could not open input {self._audio_input_idx} for the level meter: {e}")
+            self._in_stream = None
+
+    def _stop_audio_monitor(self):
+        if self._in_stream is not None:
+            try:
+                self._in_stream.stop()
+                self._in_stream.close()
+            except Exception:
+                pass
+            self._in_stream = None
+        self._audio_level = 0
+
+    def _audio_cb(self, indata, frames, t, status):
+        # PortAudio thread; a single float store is atomic under the GIL.
+        # RMS via one dot product: no temporary array, and it tracks
+        # perceived loudness better than the mean absolute value
+        data = indata[:, 0]
+        self._audio_level = float(np.sqrt(np.dot(data, data) / data.size))
 
     def _update_soundwave(self):
-        amp = min(self._audio_level * 35.0, 1.0)
+        amp = min(self._audio_level * 30.0, 1.0)
         freq = 1.5 + amp * 4.5
         self.soundwave_widget.set_wave_params(amp, freq)
 
     def on_in_changed(self, _):
-        self._start_audio_monitor()
         idx = self.in_combo.currentData()
-        for bot in self.bot_pool.values():
-            try:
-                requests.post(f"http://127.0.0.1:{bot['port']}/device_in", json={"device": idx})
-            except:
-                pass
+        self._start_audio_monitor(idx or 0)
+        self._post_all("device_in", {"device": idx})
 
     def on_out_changed(self, _):
-        idx = self.out_combo.currentData()
-        for bot in self.bot_pool.values():
-            try:
-                requests.post(f"http://127.0.0.1:{bot['port']}/device_out", json={"device": idx})
-            except:
-                pass
+        self._post_all("device_out", {"device": self.out_combo.currentData()})
 
     def closeEvent(self, event):
-        self._audio_monitor_running = False
+        self._master.stop()
+        self._stop_audio_monitor()
+        self._vol_timer.stop()
+        streams, self._streams = self._streams, {}
+        for reply in streams.values():
+            reply.abort()
+        for bot_name in list(self._pending_talk):
+            self._cancel_pending_talk(bot_name)
+        for io in self.bot_io.values():
+            io.shutdown(wait=False, cancel_futures=True)
         event.accept()
 
+    def _http_failed(self, bot_name, path, e):
+        self.http_errors[bot_name] += 1
+        self._dead_bots[bot_name] = time.monotonic() + DEAD_BOT_BACKOFF
+        if self.http_errors[bot_name] == 1:
+            print(f"[HTTP] {bot_name} /{path} failed, not polling it for {DEAD_BOT_BACKOFF:.0f} s: {e}")
+
+    def _http_ok(self, bot_name):
+        self.http_errors[bot_name] = 0
+        self._dead_bots.pop(bot_name, None)
+
+    def _is_dead(self, bot_name):
+        deadline = self._dead_bots.get(bot_name)
+        return deadline is not None and deadline > time.monotonic()
+
+    def _send(self, bot_name, path, payload=None):
+        """
+        POST to a bot over the shared session. Runs on the bot's worker.
+        """
+        from requests import RequestException
+        port = self.bot_pool[bot_name]["port"]
+        try:
+            r = self.http.post(f"http://127.0.0.1:{port}/{path}", json=payload, timeout=HTTP_TIMEOUT)
+        except RequestException as e:
+            self._http_failed(bot_name, path, e)
+            return None
+        self._http_ok(bot_name)
+        return r
+
+    def _post(self, bot_name, path, payload=None):
+        """
+        Queue a POST to a bot without blocking the UI. Each bot has a
+        single worker, so posts to the same bot keep their order.
+        """
+        return self.bot_io[bot_name].submit(self._send, bot_name, path, payload)
+
+    def _post_all(self, path, payload=None):
+        """
+        Fire-and-forget the same POST to every bot; the bots' workers
+        send them concurrently. These change bot state (delay, devices),
+        so they go to dead bots too.
+        """
+        for bot_name in self.bot_pool:
+            self._post(bot_name, path, payload)
+
+    def _schedule_talk(self, bot_name, delay_s):
+        self._cancel_pending_talk(bot_name)
+        t = QTimer(self)
+        t.setSingleShot(True)
+        t.timeout.connect(lambda: self._fire_pending_talk(bot_name))
+        t.start(int(delay_s * 1000))
+        self._pending_talk[bot_name] = t
+
+    def _fire_pending_talk(self, bot_name):
+        t = self._pending_talk.pop(bot_name, None)
+        if t is not None:
+            t.deleteLater()
+        self._post(bot_name, "talk")
+
+    def _cancel_pending_talk(self, bot_name):
+        t = self._pending_talk.pop(bot_name, None)
+        if t is not None:
+            t.stop()
+            t.deleteLater()
+
+    def _fetch_status(self, bot_name):
+        """
+        Worker side of _poll_status: GET and parse /status, then hand the
+        dict to the Qt thread through status_received.
+        """
+        from requests import RequestException
+        port = self.bot_pool[bot_name]["port"]
+        try:
+            r = self.http.get(f"http://127.0.0.1:{port}/status", timeout=POLL_TIMEOUT)
+            info = json_loads(r.content)
+        except (RequestException, ValueError) as e:
+            self._http_failed(bot_name, "status", e)
+            info = None
+        else:
+            self._http_ok(bot_name)
+        self.status_received.emit(bot_name, info)
+
+    def _open_stream(self, bot_name):
+        """
+        Subscribe to a bot's /events stream; each event is a full /status
+        report and goes through _apply_status like a poll reply.
+        """
+        port = self.bot_pool[bot_name]["port"]
+        req = QNetworkRequest(QUrl(f"http://127.0.0.1:{port}/events"))
+        req.setRawHeader(b"Accept", b"text/event-stream")
+        # Abort a stream that stops sending even keep-alives, so a hung bot
+        # or a half-open connection falls back to polling
+        req.setTransferTimeout(int(STREAM_IDLE_TIMEOUT * 1000))
+        reply = self.net.get(req)
+        self._streams[bot_name] = reply
+        self._stream_bufs[bot_name] = b""
+        reply.readyRead.connect(lambda: self._on_stream_data(bot_name, reply))
+        reply.finished.connect(lambda: self._on_stream_closed(bot_name, reply))
+
+    def _on_stream_data(self, bot_name, reply):
+        *frames, rest = (self._stream_bufs[bot_name] + bytes(reply.readAll())).split(b"\n\n")
+        self._stream_bufs[bot_name] = rest
+        # Every event is a complete snapshot, so only the newest one matters
+        for frame in reversed(frames):
+            if frame.startswith(b"data: "):
+                try:
+                    info = json_loads(frame[6:])
+                except ValueError:
+                    continue
+                self._http_ok(bot_name)
+                self._stream_down.discard(bot_name)
+                self._apply_status(bot_name, info)
+                break
+
+    def _on_stream_closed(self, bot_name, reply):
+        if self._streams.get(bot_name) is reply:
+            # Back to polling this bot; _poll_status reopens the stream
+            # after STREAM_RETRY. Polls decide whether the bot is down.
+            del self._streams[bot_name]
+            del self._stream_bufs[bot_name]
+            self._stream_retry[bot_name] = time.monotonic() + STREAM_RETRY
+            if bot_name not in self._stream_down:
+                self._stream_down.add(bot_name)
+                print(f"[HTTP] {bot_name} /events closed, polling instead: {reply.errorString()}")
+        reply.deleteLater()
+
     def _set_button_state(self, loop_name):
         state, _ = self.loop_states[loop_name]
+        color = self._COLORS.get(state, self._COLORS[2])
+        count = self.user_counts.get(loop_name, 0)
+        last_color, last_count = self._last_rendered.get(loop_name, (None, None))
+        # Restyling is the expensive part, so only touch what changed
         btn = self.buttons[loop_name]
-        if state == 0:
-            color = "#cccccc"
-        elif state == 1:
-            color = "#87cefa"
-        else:
-            color = "#90ee90"
-        btn.set_bg(color)
-        btn.set_count(self.user_counts.get(loop_name, 0))
-
-    def _start_poll(self):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._poll_status)
-        self.timer.start(int(POLL_INTERVAL*1000))
+        if color != last_color:
+            btn.set_bg(color)
+        if count != last_count:
+            btn.set_count(count)
+        self._last_rendered[loop_name] = (color, count)
 
     def _poll_status(self):
-        for bot_name, bot in self.bot_pool.items():
-            try:
-                r = requests.get(f"http://127.0.0.1:{bot['port']}/status", timeout=0.5)
-                info = r.json()
-                if "user_counts" in info:
-                    for loop in LOOPS:
-                        name = loop["name"]
-                        self.user_counts[name] = info["user_counts"].get(name, 0)
-            except:
-                pass
+        # Only bots without a live /events stream are polled. Fire the
+        # requests and return; replies arrive via _apply_status
+        now = time.monotonic()
+        for bot_name in self.bot_pool:
+            if bot_name in self._streams or self._is_dead(bot_name):
+                continue
+            if self._stream_retry.get(bot_name, 0.0) <= now:
+                self._open_stream(bot_name)
+            if bot_name in self._polling:
+                continue  # previous request to this bot is still pending
+            self._polling.add(bot_name)
+            self.bot_io[bot_name].submit(self._fetch_status, bot_name)
+
+    def _apply_status(self, bot_name, info):
+        self._polling.discard(bot_name)
+        if not isinstance(info, dict):
+            return
+        counts = info.get("user_counts")
+        if counts is None:
+            return
         for loop in LOOPS:
-            self._set_button_state(loop["name"])
+            name = loop["name"]
+            n = counts.get(name, 0)
+            if self.user_counts[name] != n:
+                self.user_counts[name] = n
+                self._set_button_state(name)
 
     def _find_idle_bot(self):
-        idle_bots = [(name, data) for name, data in self.bot_pool.items() if data["assigned"] is None]
-        if not idle_bots:
-            return None
-        idle_bots.sort(key=lambda x: x[1]["last_used"])
-        return idle_bots[0][0]
+        # Pop the least recently used idle bot; the caller assigns it
+        while self._idle_heap:
+            last_used, name = heapq.heappop(self._idle_heap)
+            data = self.bot_pool[name]
+            if data["assigned"] is None and data["last_used"] == last_used:
+                return name
+        return None
 
     def _update_bot_assignment(self, loop_name, new_state):
         loop_cfg = self.loop_configs[loop_name]
         old_state, old_bot = self.loop_states[loop_name]
         assigned_bot = old_bot
-        post = requests.post
+        if old_bot:
+            # A delayed /talk must not fire after the loop has moved on
+            self._cancel_pending_talk(old_bot)
 
         if loop_cfg["can_listen"] and not loop_cfg["can_talk"]:
             if new_state > 1:
@@ -341,15 +600,16 @@ class MainWindow(QWidget):
 
         if new_state == 0:
             if old_bot:
-                port = self.bot_pool[old_bot]["port"]
                 if self.delay_enabled and old_state == 2:
-                    post(f"http://127.0.0.1:{port}/leave_after_delay")
+                    self._post(old_bot, "leave_after_delay")
                 else:
-                    post(f"http://127.0.0.1:{port}/leave")
-                    post(f"http://127.0.0.1:{port}/mute")
+                    self._post(old_bot, "leave")
+                    self._post(old_bot, "mute")
                 self.bot_pool[old_bot]["assigned"] = None
                 self.bot_pool[old_bot]["last_used"] = time.time()
+                heapq.heappush(self._idle_heap, (self.bot_pool[old_bot]["last_used"], old_bot))
             self.loop_states[loop_name] = (0, None)
+            self._talking.discard(loop_name)
             return
 
         if not assigned_bot:
@@ -357,34 +617,34 @@ class MainWindow(QWidget):
             if not assigned_bot:
                 return
             self.bot_pool[assigned_bot]["assigned"] = loop_name
-        port = self.bot_pool[assigned_bot]["port"]
 
         if new_state == 2:
-            for other_loop in LOOPS:
-                other_name = other_loop["name"]
-                if other_name == loop_name:
-                    continue
-                ostate, obot = self.loop_states[other_name]
-                if ostate == 2 and obot:
-                    oport = self.bot_pool[obot]["port"]
-                    if self.delay_enabled:
-                        post(f"http://127.0.0.1:{oport}/mute_after_delay")
-                    else:
-                        post(f"http://127.0.0.1:{oport}/mute")
-                    self.loop_states[other_name] = (1, obot)
-                    self.bot_pool[obot]["last_used"] = time.time()
-                    self._set_button_state(other_name)
-            post(f"http://127.0.0.1:{port}/join", json={"loop": loop_name})
+            muting = []
+            for other_name in self._talking - {loop_name}:
+                _, obot = self.loop_states[other_name]
+                self._cancel_pending_talk(obot)
+                if self.delay_enabled:
+                    muting.append(self._post(obot, "mute_after_delay"))
+                else:
+                    muting.append(self._post(obot, "mute"))
+                self.loop_states[other_name] = (1, obot)
+                self.bot_pool[obot]["last_used"] = time.time()
+                self._set_button_state(other_name)
+            self._talking = {loop_name}
+            # Give the other loops a moment to mute before this one talks
+            wait(muting, timeout=0.2)
+            self._post(assigned_bot, "join", {"loop": loop_name})
             if self.delay_enabled:
-                threading.Timer(self.delay_seconds, lambda: post(f"http://127.0.0.1:{port}/talk")).start()
+                self._schedule_talk(assigned_bot, self.delay_seconds)
             else:
-                post(f"http://127.0.0.1:{port}/talk")
+                self._post(assigned_bot, "talk")
         elif new_state == 1:
+            self._talking.discard(loop_name)
             if old_state == 2 and self.delay_enabled:
-                post(f"http://127.0.0.1:{port}/mute_after_delay")
+                self._post(assigned_bot, "mute_after_delay")
             else:
-                post(f"http://127.0.0.1:{port}/join", json={"loop": loop_name})
-                post(f"http://127.0.0.1:{port}/mute")
+                self._post(assigned_bot, "join", {"loop": loop_name})
+                self._post(assigned_bot, "mute")
 
         self.bot_pool[assigned_bot]["assigned"] = loop_name
         self.bot_pool[assigned_bot]["last_used"] = time.time()
@@ -411,18 +671,25 @@ class MainWindow(QWidget):
         self._set_button_state(loop_name)
 
     def on_volume_changed(self, loop_name, volume):
-        # Find the assigned bot for this loop
-        bot_name = self.loop_states[loop_name][1]
-        if bot_name:
-            port = self.bot_pool[bot_name]['port']
-            try:
-                requests.post(f'http://127.0.0.1:{port}/set_volume', json={'volume': volume}, timeout=0.5)
-            except Exception as e:
-                print(f"Could not set volume for {loop_name}: {e}")
+        if not self.loop_states[loop_name][1]:
+            return
+        # Coalesce slider drags: keep only the latest value per loop and
+        # send at most one /set_volume per loop every VOLUME_FLUSH_MS
+        self._vol_pending[loop_name] = volume
+        if not self._vol_timer.isActive():
+            self._vol_timer.start()
+
+    def _flush_volumes(self):
+        pending, self._vol_pending = self._vol_pending, {}
+        for loop_name, volume in pending.items():
+            # Find the assigned bot for this loop
+            bot_name = self.loop_states[loop_name][1]
+            if bot_name:
+                self._post(bot_name, "set_volume", {"volume": volume})
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("logo2.png"))
+    app.setWindowIcon(_app_icon())
     w   = MainWindow()
     w.show()
     sys.exit(app.exec())
@@ -1,8 +1,27 @@
 # soundwave.py
 import numpy as np
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QPainter, QColor, QPen, QPolygonF
+
+N_SEGMENTS = 38  # line segments across the widget
+N_POINTS   = N_SEGMENTS + 1
+FLAT_AMP   = 1e-3  # amplitude below which the wave is drawn as a flat line
+QUIET_AMP  = 0.05  # amplitude below which the animation runs at a lower frame rate
+QUIET_TICK_DIVIDER = 2  # when quiet, advance on every Nth tick only
+
+# One sine period sampled at LUT_SIZE points (a power of two, so indices wrap with a mask).
+# Kept as float64 so lookups land straight in the polygon's coordinate buffer.
+LUT_SIZE = 1024
+_SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, LUT_SIZE, endpoint=False))
+
+def _polygon_view(poly):
+    """
+    Return an (n, 2) float64 numpy view of a QPolygonF's point storage.
+    """
+    buf = poly.data()
+    buf.setsize(len(poly) * 2 * 8)
+    return np.frombuffer(buf, np.float64).reshape(-1, 2)
 
 class SoundwaveWidget(QWidget):
     def __init__(self, parent=None):
@@ -11,21 +30,49 @@ class SoundwaveWidget(QWidget):
         self.amplitude = 0.0
         self.frequency = 2.0
         self.phase = 0.0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_phase)
-        self.timer.start(30)
+        self._last_amp = 0.0
+        self._i = np.arange(N_POINTS, dtype=np.float32)     # point indices
+        self._lut_step = self._i * (LUT_SIZE / N_SEGMENTS)  # LUT periods per unit frequency
+        # The polyline is drawn straight from this polygon; numpy writes its
+        # points in place, so painting allocates no per-point Python objects
+        self._poly = QPolygonF()
+        self._poly.fill(QPointF(), N_POINTS)
+        self._coords = _polygon_view(self._poly)
+        self._coords[:, 0] = self._i * (self.width() / N_SEGMENTS)
+        self._ys = self._coords[:, 1]
+        # Per-frame scratch
+        self._pos = np.empty(N_POINTS, dtype=np.float32)
+        self._idx = np.empty(N_POINTS, dtype=np.int32)
+        self._sin = np.empty(N_POINTS, dtype=np.float64)
+        self._ticks = 0
         self.setStyleSheet("background: transparent;")
 
+    def _is_flat(self):
+        # Flat now and at the previous update: the last paint is still correct
+        return self.amplitude < FLAT_AMP and self._last_amp < FLAT_AMP
+
     def update_phase(self):
-        self.phase += 0.17 * self.frequency
+        """
+        Advance the wave by one tick of the owner's timer.
+        """
+        if self._is_flat():
+            return
+        self._ticks += 1
+        if FLAT_AMP <= self.amplitude < QUIET_AMP and self._ticks % QUIET_TICK_DIVIDER:
+            return
+        self.phase = (self.phase + 0.17 * self.frequency) % (2 * np.pi)
         self.update()
 
     def set_wave_params(self, amp, freq):
         amp = np.clip(amp, 0, 1)
         freq = np.clip(freq, 1.5, 6.0)
+        self._last_amp = self.amplitude
         self.amplitude = self.amplitude * 0.7 + amp * 0.3
         self.frequency = self.frequency * 0.7 + freq * 0.3
-        self.update()
+
+    def resizeEvent(self, event):
+        self._coords[:, 0] = self._i * (self.width() / N_SEGMENTS)
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -37,18 +84,19 @@ class SoundwaveWidget(QWidget):
         pen = QPen(QColor(0, 0, 0), 1)  # Black line
         painter.setPen(pen)
 
-        N = 38
         freq = self.frequency
         amp = self.amplitude * (h / 2 - 7)
-        points = []
         if amp < 1e-3:  # Practically zero
             # Draw a flat line (no frequency matters)
             painter.drawLine(0, int(mid_y), w, int(mid_y))
         else:
-            for i in range(N + 1):
-                x = i * w / N
-                y = mid_y + amp * np.sin(2 * np.pi * freq * i / N + self.phase)
-                points.append((x, y))
-            for i in range(N):
-                painter.drawLine(int(points[i][0]), int(points[i][1]), int(points[i+1][0]), int(points[i+1][1]))
+            # Sine via table lookup, written into the polygon's y column
+            np.multiply(self._lut_step, freq, out=self._pos)
+            self._pos += self.phase * (LUT_SIZE / (2 * np.pi))
+            np.copyto(self._idx, self._pos, casting='unsafe')
+            self._idx &= LUT_SIZE - 1
+            np.take(_SIN_LUT, self._idx, out=self._sin, mode='clip')
+            self._sin *= amp
+            np.add(self._sin, mid_y, out=self._ys)
+            painter.drawPolyline(self._poly)
         painter.end()
@@ -1,12 +1,16 @@
 import os
+import signal
+import socket
 import subprocess
 import time
 import sys
-import psutil
 
 from config_dialog import get_config_from_dialog, read_config
 
 DIR = os.path.dirname(sys.executable)
+READY_TIMEOUT = 10.0  # seconds to wait for the bots' API ports before starting the GUI anyway
+READY_POLL    = 0.05
+POSIX = os.name == "posix"
 
 # Only prompt on first run, reuse config otherwise
 config = get_config_from_dialog()
@@ -16,53 +20,122 @@ PORT = config['port']
 BOT_BASE = config['bot_base']
 
 bots = [
-    [os.path.join(DIR, "bot_server"), "--server", SERVER, "--port", str(PORT), "--bot-name", f"{BOT_BASE}", "--api-port", "6001"],
-    [os.path.join(DIR, "bot_server"), "--server", SERVER, "--port", str(PORT), "--bot-name", f"{BOT_BASE}1", "--api-port", "6002"],
-    [os.path.join(DIR, "bot_server"), "--server", SERVER, "--port", str(PORT), "--bot-name", f"{BOT_BASE}2", "--api-port", "6003"]
+    (6001, [os.path.join(DIR, "bot_server"), "--server", SERVER, "--port", str(PORT), "--bot-name", f"{BOT_BASE}", "--api-port", "6001"]),
+    (6002, [os.path.join(DIR, "bot_server"), "--server", SERVER, "--port", str(PORT), "--bot-name", f"{BOT_BASE}1", "--api-port", "6002"]),
+    (6003, [os.path.join(DIR, "bot_server"), "--server", SERVER, "--port", str(PORT), "--bot-name", f"{BOT_BASE}2", "--api-port", "6003"]),
 ]
 
-procs = []
-for cmd in bots:
+def is_up(port):
     try:
-        print(f"Starting bot: {cmd}")
-        p = subprocess.Popen(cmd, cwd=DIR)
-    except Exception as e:
-        print(f"Could not start bot: {cmd}: {e}")
-        continue
-    procs.append(p)
-
-time.sleep(2)
+        with socket.create_connection(("127.0.0.1", port), timeout=READY_POLL):
+            return True
+    except OSError:
+        return False
 
-gui_cmd = [os.path.join(DIR, "gui")]
-try:
-    print(f"Launching GUI: {gui_cmd}")
-    subprocess.call(gui_cmd, cwd=DIR)
-except Exception as e:
-    print(f"Failed to launch GUI: {e}")
+def wait_for_bots(bot_procs, timeout=READY_TIMEOUT):
+    """
+    Return once every bot in `bot_procs` ((port, Popen) pairs) accepts
+    connections or has exited, or after `timeout`.
+    """
+    pending = dict(bot_procs)
+    deadline = time.monotonic() + timeout
+    while pending:
+        for port, p in list(pending.items()):
+            if p.poll() is not None:
+                print(f"Bot on port {port} exited with code {p.returncode}")
+                del pending[port]
+            elif is_up(port):
+                del pending[port]
+        if not pending or time.monotonic() > deadline:
+            break
+        time.sleep(READY_POLL)
+    if pending:
+        print(f"Bots on ports {sorted(pending)} not ready after {timeout:g}s, starting GUI anyway")
 
-for p in procs:
-    try:
-        print(f"Terminating bot process PID: {p.pid}")
+def stop(p, force=False):
+    if POSIX:
+        try:
+            os.killpg(p.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    elif force:
+        p.kill()
+    else:
         p.terminate()
+
+def cleanup():
+    # Don't let a second Ctrl-C or signal cut the shutdown short
+    for sig in EXIT_SIGNALS + (signal.SIGINT,):
+        signal.signal(sig, signal.SIG_IGN)
+
+    if gui is not None and gui.poll() is None:
+        print(f"Terminating GUI process PID: {gui.pid}")
+        gui.terminate()
+
+    for p in procs:
         try:
-            p.wait(timeout=3)
-        except subprocess.TimeoutExpired:
-            print(f"Bot PID {p.pid} did not exit in time. Killing...")
-            p.kill()
-    except Exception as e:
-        print(f"Error terminating bot process: {e}")
+            print(f"Terminating bot process PID: {p.pid}")
+            stop(p)
+            try:
+                p.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                print(f"Bot PID {p.pid} did not exit in time. Killing...")
+                stop(p, force=True)
+        except Exception as e:
+            print(f"Error terminating bot process: {e}")
 
-print("All bots terminated. Exiting app.")
+    if not POSIX:
+        # No process groups to kill here; sweep for any bot_server left behind
+        try:
+            import psutil
+            for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline']):
+                if proc.info['name'] and 'bot_server' in proc.info['name']:
+                    print(f"Forcibly killing leftover bot_server PID={proc.pid}")
+                    try:
+                        proc.kill()
+                    except Exception as e:
+                        print(f"Could not kill PID={proc.pid}: {e}")
+        except Exception as e:
+            print(f"psutil cleanup failed: {e}")
+
+def on_exit_signal(signum, frame):
+    # Unwind through the try/finally below so the bots get stopped
+    raise SystemExit(128 + signum)
 
+# The bots run in their own sessions, so terminal signals no longer reach
+# them directly; the launcher has to pass them on
+EXIT_SIGNALS = (signal.SIGTERM,) + ((signal.SIGHUP,) if hasattr(signal, "SIGHUP") else ())
+for sig in EXIT_SIGNALS:
+    signal.signal(sig, on_exit_signal)
+
+procs = []
+gui = None
 try:
-    for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline']):
-        if proc.info['name'] and 'bot_server' in proc.info['name']:
-            print(f"Forcibly killing leftover bot_server PID={proc.pid}")
-            try:
-                proc.kill()
-            except Exception as e:
-                print(f"Could not kill PID={proc.pid}: {e}")
-except Exception as e:
-    print(f"psutil cleanup failed: {e}")
+    started = []
+    for port, cmd in bots:
+        try:
+            print(f"Starting bot: {cmd}")
+            # On POSIX each bot leads its own process group, so stopping it
+            # also reaches anything it spawned
+            p = subprocess.Popen(cmd, cwd=DIR, start_new_session=POSIX)
+        except Exception as e:
+            print(f"Could not start bot: {cmd}: {e}")
+            continue
+        procs.append(p)
+        started.append((port, p))
+
+    wait_for_bots(started)
+
+    gui_cmd = [os.path.join(DIR, "gui")]
+    try:
+        print(f"Launching GUI: {gui_cmd}")
+        gui = subprocess.Popen(gui_cmd, cwd=DIR)
+        gui.wait()
+    except Exception as e:
+        print(f"Failed to launch GUI: {e}")
+except KeyboardInterrupt:
+    print("Interrupted, stopping bots.")
+finally:
+    cleanup()
 
 print("All bots terminated. Exiting app.")